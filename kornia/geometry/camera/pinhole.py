@@ -6,6 +6,7 @@ import torch.nn as nn
 
 from kornia.geometry.linalg import transform_points
 from kornia.geometry.linalg import inverse_transformation
+from kornia.geometry.conversions import rtvec_to_pose
 
 
 class PinholeCamera:
@@ -575,7 +576,7 @@ def pixel2cam(depth: torch.Tensor, intrinsics_inv: torch.Tensor,
         raise ValueError("Input pixel_coords has to be in the shape of "
                          "BxHxWx3. Got {}".format(intrinsics_inv.shape))
     cam_coords: torch.Tensor = transform_points(
-        intrinsics_inv[:, None], pixel_coords)
+        intrinsics_inv[:, None], pixel_coords, projection=False)
     return cam_coords * depth.permute(0, 2, 3, 1)
 
 
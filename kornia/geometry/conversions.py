@@ -1,3 +1,6 @@
+import math
+from typing import Optional
+
 import torch
 import torch.nn as nn
 import torch.nn.functional as F
@@ -12,6 +15,7 @@ __all__ = [
     "convert_points_to_homogeneous",
     "convert_affinematrix_to_homography",
     "angle_axis_to_rotation_matrix",
+    "rtvec_to_pose",
     "angle_axis_to_quaternion",
     "rotation_matrix_to_angle_axis",
     "rotation_matrix_to_quaternion",
@@ -44,7 +48,7 @@ def rad2deg(tensor: torch.Tensor) -> torch.Tensor:
         raise TypeError("Input type is not a torch.Tensor. Got {}".format(
             type(tensor)))
 
-    return 180. * tensor / pi.to(tensor.device).type(tensor.dtype)
+    return tensor * (180. / math.pi)
 
 
 def deg2rad(tensor: torch.Tensor) -> torch.Tensor:
@@ -65,7 +69,7 @@ def deg2rad(tensor: torch.Tensor) -> torch.Tensor:
         raise TypeError("Input type is not a torch.Tensor. Got {}".format(
             type(tensor)))
 
-    return tensor * pi.to(tensor.device).type(tensor.dtype) / 180.
+    return tensor * (math.pi / 180.)
 
 
 def convert_points_from_homogeneous(
@@ -92,10 +96,10 @@ def convert_points_from_homogeneous(
     # follow the convention of opencv:
     # https://github.com/opencv/opencv/pull/14411/files
     mask: torch.Tensor = torch.abs(z_vec) > eps
-    scale: torch.Tensor = torch.ones_like(z_vec).masked_scatter_(
-        mask, torch.tensor(1.0).to(points.device) / z_vec[mask])
+    scale: torch.Tensor = torch.reciprocal(
+        torch.where(mask, z_vec, torch.ones_like(z_vec)))
 
-    return scale * points[..., :-1]
+    return points[..., :-1] * scale
 
 
 def convert_points_to_homogeneous(points: torch.Tensor) -> torch.Tensor:
@@ -135,18 +139,23 @@ def convert_affinematrix_to_homography(A: torch.Tensor) -> torch.Tensor:
     return H
 
 
-def angle_axis_to_rotation_matrix(angle_axis: torch.Tensor) -> torch.Tensor:
+def angle_axis_to_rotation_matrix(
+        angle_axis: torch.Tensor,
+        out: Optional[torch.Tensor] = None) -> torch.Tensor:
     r"""Convert 3d vector of axis-angle rotation to 3x3 rotation matrix
 
     Args:
         angle_axis (torch.Tensor): tensor of 3d vector of axis-angle rotations.
+        out (Optional[torch.Tensor]): tensor of shape :math:`(*, 3, 3)` where
+          the result is written, e.g. a view of a preallocated pose buffer.
+          Default: None.
 
     Returns:
         torch.Tensor: tensor of 3x3 rotation matrices.
 
     Shape:
-        - Input: :math:`(N, 3)`
-        - Output: :math:`(N, 3, 3)`
+        - Input: :math:`(*, 3)` where `*` means, any number of dimensions
+        - Output: :math:`(*, 3, 3)`
 
     Example:
         >>> input = torch.rand(1, 3)  # Nx3
@@ -172,31 +181,41 @@ def angle_axis_to_rotation_matrix(angle_axis: torch.Tensor) -> torch.Tensor:
         cos_theta = torch.cos(theta)
         sin_theta = torch.sin(theta)
 
-        r00 = cos_theta + wx * wx * (k_one - cos_theta)
-        r10 = wz * sin_theta + wx * wy * (k_one - cos_theta)
-        r20 = -wy * sin_theta + wx * wz * (k_one - cos_theta)
-        r01 = wx * wy * (k_one - cos_theta) - wz * sin_theta
-        r11 = cos_theta + wy * wy * (k_one - cos_theta)
-        r21 = wx * sin_theta + wy * wz * (k_one - cos_theta)
-        r02 = wy * sin_theta + wx * wz * (k_one - cos_theta)
-        r12 = -wx * sin_theta + wy * wz * (k_one - cos_theta)
-        r22 = cos_theta + wz * wz * (k_one - cos_theta)
+        # precompute the terms shared between the matrix elements
+        one_minus_cos = k_one - cos_theta
+        wx_c = wx * one_minus_cos
+        wy_c = wy * one_minus_cos
+        wxx, wxy, wxz = wx * wx_c, wy * wx_c, wz * wx_c
+        wyy, wyz, wzz = wy * wy_c, wz * wy_c, wz * wz * one_minus_cos
+        wx_s, wy_s, wz_s = wx * sin_theta, wy * sin_theta, wz * sin_theta
+
+        r00 = cos_theta + wxx
+        r10 = wz_s + wxy
+        r20 = wxz - wy_s
+        r01 = wxy - wz_s
+        r11 = cos_theta + wyy
+        r21 = wx_s + wyz
+        r02 = wy_s + wxz
+        r12 = wyz - wx_s
+        r22 = cos_theta + wzz
         rotation_matrix = torch.cat(
             [r00, r01, r02, r10, r11, r12, r20, r21, r22], dim=1)
-        return rotation_matrix.view(-1, 3, 3)
+        return rotation_matrix  # Nx9
 
     def _compute_rotation_matrix_taylor(angle_axis):
         rx, ry, rz = torch.chunk(angle_axis, 3, dim=1)
         k_one = torch.ones_like(rx)
         rotation_matrix = torch.cat(
             [k_one, -rz, ry, rz, k_one, -rx, -ry, rx, k_one], dim=1)
-        return rotation_matrix.view(-1, 3, 3)
+        return rotation_matrix  # Nx9
 
     # stolen from ceres/rotation.h
 
-    _angle_axis = torch.unsqueeze(angle_axis, dim=1)
-    theta2 = torch.matmul(_angle_axis, _angle_axis.transpose(1, 2))
-    theta2 = torch.squeeze(theta2, dim=1)
+    # flatten the leading dimensions to process all the rotations at once
+    batch_shape = angle_axis.shape[:-1]
+    angle_axis = angle_axis.reshape(-1, 3)
+
+    theta2 = torch.sum(angle_axis * angle_axis, dim=1, keepdim=True)  # Nx1
 
     # compute rotation matrices
     rotation_matrix_normal = _compute_rotation_matrix(angle_axis, theta2)
@@ -204,18 +223,60 @@ def angle_axis_to_rotation_matrix(angle_axis: torch.Tensor) -> torch.Tensor:
 
     # create mask to handle both cases
     eps = 1e-6
-    mask = (theta2 > eps).view(-1, 1, 1).to(theta2.device)
-    mask_pos = (mask).type_as(theta2)
-    mask_neg = (mask == False).type_as(theta2)  # noqa
+    mask = theta2 > eps  # Nx1
+
+    # create output matrix selecting the valid case per element
+    rotation_matrix = torch.where(
+        mask, rotation_matrix_normal, rotation_matrix_taylor)  # Nx9
+    rotation_matrix = rotation_matrix.view(*batch_shape, 3, 3)  # *x3x3
+    if out is not None:
+        if not out.shape == rotation_matrix.shape:
+            raise ValueError(
+                "Output size must be a {} tensor. Got {}".format(
+                    tuple(rotation_matrix.shape), out.shape))
+        return out.copy_(rotation_matrix)
+    return rotation_matrix
+
+
+def rtvec_to_pose(rtvec: torch.Tensor) -> torch.Tensor:
+    r"""Convert axis-angle rotation and translation vectors to 4x4 poses.
+
+    The pose buffer is allocated once and the rotation matrix is copied into
+    its top-left 3x3 block.
+
+    Args:
+        rtvec (torch.Tensor): tensor of vectors of the form
+          :math:`(r_x, r_y, r_z, t_x, t_y, t_z)`, where :math:`(r_x, r_y, r_z)`
+          is the rotation in axis-angle convention and :math:`(t_x, t_y, t_z)`
+          the translation.
+
+    Returns:
+        torch.Tensor: tensor of 4x4 pose matrices.
+
+    Shape:
+        - Input: :math:`(*, 6)`
+        - Output: :math:`(*, 4, 4)`
+
+    Example:
+        >>> input = torch.rand(3, 6)  # Nx6
+        >>> output = kornia.rtvec_to_pose(input)  # Nx4x4
+    """
+    if not isinstance(rtvec, torch.Tensor):
+        raise TypeError("Input type is not a torch.Tensor. Got {}".format(
+            type(rtvec)))
 
+    if not rtvec.shape[-1] == 6:
+        raise ValueError(
+            "Input size must be a (*, 6) tensor. Got {}".format(
+                rtvec.shape))
     # create output pose matrix
-    batch_size = angle_axis.shape[0]
-    rotation_matrix = torch.eye(3).to(angle_axis.device).type_as(angle_axis)
-    rotation_matrix = rotation_matrix.view(1, 3, 3).repeat(batch_size, 1, 1)
-    # fill output matrix with masked values
-    rotation_matrix[..., :3, :3] = \
-        mask_pos * rotation_matrix_normal + mask_neg * rotation_matrix_taylor
-    return rotation_matrix  # Nx4x4
+    pose: torch.Tensor = torch.zeros(
+        *rtvec.shape[:-1], 4, 4, device=rtvec.device, dtype=rtvec.dtype)
+    pose[..., 3, 3] = 1.0
+    # copy the rotation and translation into their blocks of the pose
+    angle_axis_to_rotation_matrix(rtvec[..., :3], out=pose[..., :3, :3])
+    pose[..., :3, 3] = rtvec[..., 3:]
+    return pose  # *x4x4
 
 
 def rotation_matrix_to_angle_axis(
@@ -278,57 +339,72 @@ def rotation_matrix_to_quaternion(
             "Input size must be a (*, 3, 3) tensor. Got {}".format(
                 rotation_matrix.shape))
 
-    def safe_zero_division(numerator: torch.Tensor,
-                           denominator: torch.Tensor) -> torch.Tensor:
-        eps: float = torch.finfo(numerator.dtype).tiny  # type: ignore
-        return numerator / torch.clamp(denominator, min=eps)
+    def safe_rsqrt(value: torch.Tensor) -> torch.Tensor:
+        eps: float = torch.finfo(value.dtype).tiny  # type: ignore
+        return torch.rsqrt(torch.clamp(value, min=eps))
 
-    rotation_matrix_vec: torch.Tensor = rotation_matrix.view(
-        *rotation_matrix.shape[:-2], 9)
-
-    m00, m01, m02, m10, m11, m12, m20, m21, m22 = torch.chunk(
-        rotation_matrix_vec, chunks=9, dim=-1)
+    # read the elements as views of the input rows, so that non contiguous
+    # inputs (e.g. transposed matrices) are neither copied nor rejected.
+    m00, m01, m02 = torch.chunk(rotation_matrix[..., 0, :], chunks=3, dim=-1)
+    m10, m11, m12 = torch.chunk(rotation_matrix[..., 1, :], chunks=3, dim=-1)
+    m20, m21, m22 = torch.chunk(rotation_matrix[..., 2, :], chunks=3, dim=-1)
 
     trace: torch.Tensor = m00 + m11 + m22
 
     def trace_positive_cond():
-        sq = torch.sqrt(trace + 1.0) * 2.  # sq = 4 * qw.
-        qw = 0.25 * sq
-        qx = safe_zero_division(m21 - m12, sq)
-        qy = safe_zero_division(m02 - m20, sq)
-        qz = safe_zero_division(m10 - m01, sq)
+        sq = trace + 1.0  # sq = (2 * qw) ** 2.
+        inv_sq = 0.5 * safe_rsqrt(sq)  # inv_sq = 1 / (4 * qw).
+        qw = sq * inv_sq
+        qx = (m21 - m12) * inv_sq
+        qy = (m02 - m20) * inv_sq
+        qz = (m10 - m01) * inv_sq
         return torch.cat([qx, qy, qz, qw], dim=-1)
 
     def cond_1():
-        sq = torch.sqrt(1.0 + m00 - m11 - m22 + eps) * 2.  # sq = 4 * qx.
-        qw = safe_zero_division(m21 - m12, sq)
-        qx = 0.25 * sq
-        qy = safe_zero_division(m01 + m10, sq)
-        qz = safe_zero_division(m02 + m20, sq)
+        sq = 1.0 + m00 - m11 - m22 + eps  # sq = (2 * qx) ** 2.
+        inv_sq = 0.5 * safe_rsqrt(sq)  # inv_sq = 1 / (4 * qx).
+        qw = (m21 - m12) * inv_sq
+        qx = sq * inv_sq
+        qy = (m01 + m10) * inv_sq
+        qz = (m02 + m20) * inv_sq
         return torch.cat([qx, qy, qz, qw], dim=-1)
 
     def cond_2():
-        sq = torch.sqrt(1.0 + m11 - m00 - m22 + eps) * 2.  # sq = 4 * qy.
-        qw = safe_zero_division(m02 - m20, sq)
-        qx = safe_zero_division(m01 + m10, sq)
-        qy = 0.25 * sq
-        qz = safe_zero_division(m12 + m21, sq)
+        sq = 1.0 + m11 - m00 - m22 + eps  # sq = (2 * qy) ** 2.
+        inv_sq = 0.5 * safe_rsqrt(sq)  # inv_sq = 1 / (4 * qy).
+        qw = (m02 - m20) * inv_sq
+        qx = (m01 + m10) * inv_sq
+        qy = sq * inv_sq
+        qz = (m12 + m21) * inv_sq
         return torch.cat([qx, qy, qz, qw], dim=-1)
 
     def cond_3():
-        sq = torch.sqrt(1.0 + m22 - m00 - m11 + eps) * 2.  # sq = 4 * qz.
-        qw = safe_zero_division(m10 - m01, sq)
-        qx = safe_zero_division(m02 + m20, sq)
-        qy = safe_zero_division(m12 + m21, sq)
-        qz = 0.25 * sq
+        sq = 1.0 + m22 - m00 - m11 + eps  # sq = (2 * qz) ** 2.
+        inv_sq = 0.5 * safe_rsqrt(sq)  # inv_sq = 1 / (4 * qz).
+        qw = (m10 - m01) * inv_sq
+        qx = (m02 + m20) * inv_sq
+        qy = (m12 + m21) * inv_sq
+        qz = sq * inv_sq
         return torch.cat([qx, qy, qz, qw], dim=-1)
 
-    where_2 = torch.where(m11 > m22, cond_2(), cond_3())
-    where_1 = torch.where(
-        (m00 > m11) & (m00 > m22), cond_1(), where_2)
-
-    quaternion: torch.Tensor = torch.where(
-        trace > 0., trace_positive_cond(), where_1)
+    # index of the case to use per matrix: 0 if the trace is positive,
+    # otherwise 1, 2 or 3 depending on the largest diagonal element.
+    mask_trace: torch.Tensor = trace > 0.
+    mask_d0: torch.Tensor = (m00 > m11) & (m00 > m22)
+    mask_d1: torch.Tensor = m11 > m22
+    # the two bits of the case index, combined with boolean algebra
+    case_bit0: torch.Tensor = ~mask_trace & (mask_d0 | ~mask_d1)  # case 1 or 3
+    case_bit1: torch.Tensor = ~mask_trace & ~mask_d0  # case 2 or 3
+    case: torch.Tensor = case_bit0.long() + 2 * case_bit1.long()  # *x1
+
+    # all four candidates are stacked in a *x4x4 tensor and the selected one
+    # is read with a single gather (the index is an expanded view).
+    quaternion_cases: torch.Tensor = torch.stack([
+        trace_positive_cond(), cond_1(), cond_2(), cond_3()], dim=-2)  # *x4x4
+    index: torch.Tensor = case.unsqueeze(-1).expand(*case.shape[:-1], 1, 4)
+
+    quaternion: torch.Tensor = torch.gather(
+        quaternion_cases, -2, index).squeeze(-2)
     return quaternion
 
 
@@ -464,14 +540,12 @@ def quaternion_to_angle_axis(quaternion: torch.Tensor) -> torch.Tensor:
         cos_theta < 0.0, torch.atan2(-sin_theta, -cos_theta),
         torch.atan2(sin_theta, cos_theta))
 
-    k_pos: torch.Tensor = two_theta / sin_theta
-    k_neg: torch.Tensor = 2.0 * torch.ones_like(sin_theta)
+    k_pos: torch.Tensor = two_theta * torch.rsqrt(sin_squared_theta)
+    k_neg: torch.Tensor = torch.full_like(sin_theta, 2.0)
     k: torch.Tensor = torch.where(sin_squared_theta > 0.0, k_pos, k_neg)
 
-    angle_axis: torch.Tensor = torch.zeros_like(quaternion)[..., :3]
-    angle_axis[..., 0] += q1 * k
-    angle_axis[..., 1] += q2 * k
-    angle_axis[..., 2] += q3 * k
+    # scale the three vector components at once
+    angle_axis: torch.Tensor = quaternion[..., 1:] * k.unsqueeze(-1)
     return angle_axis
 
 
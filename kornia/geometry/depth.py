@@ -162,7 +162,7 @@ def warp_frame_depth(
     points_3d_dst = points_3d_dst.permute(0, 2, 3, 1)  # BxHxWx3
 
     # apply transformation to the 3d points
-    points_3d_src = transform_points(src_trans_dst[:, None], points_3d_dst)  # BxHxWx3
+    points_3d_src = transform_points(src_trans_dst[:, None], points_3d_dst, projection=False)  # BxHxWx3
 
     # project back to pixels
     camera_matrix_tmp: torch.Tensor = camera_matrix[:, None, None]  # Bx1x1xHxW
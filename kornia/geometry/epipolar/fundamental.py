@@ -41,7 +41,7 @@ def normalize_points(points: torch.Tensor, eps: float = 1e-8) -> Tuple[torch.Ten
         zeros, zeros, ones], dim=-1)  # Bx9
 
     transform = transform.view(-1, 3, 3)  # Bx3x3
-    points_norm = kornia.transform_points(transform, points)  # BxNx2
+    points_norm = kornia.transform_points(transform, points, projection=False)  # BxNx2
 
     return (points_norm, transform)
 
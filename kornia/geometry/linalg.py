@@ -2,7 +2,6 @@ from typing import Optional
 
 import torch
 import kornia
-from kornia.geometry.conversions import convert_points_to_homogeneous
 from kornia.geometry.conversions import convert_points_from_homogeneous
 
 
@@ -176,13 +175,22 @@ def relative_transformation(
 
 
 def transform_points(trans_01: torch.Tensor,
-                     points_1: torch.Tensor) -> torch.Tensor:
+                     points_1: torch.Tensor,
+                     projection: bool = True,
+                     out: Optional[torch.Tensor] = None) -> torch.Tensor:
     r"""Function that applies transformations to a set of points.
 
     Args:
         trans_01 (torch.Tensor): tensor for transformations of shape
           :math:`(B, D+1, D+1)`.
         points_1 (torch.Tensor): tensor of points of shape :math:`(B, N, D)`.
+        projection (bool): whether the transformations can be projective. If
+          set to False, the last row of :math:`trans_01` is assumed to be
+          :math:`[0, ..., 0, 1]` and the points are transformed by the affine
+          part only, skipping the homogeneous coordinates. Default: True.
+        out (Optional[torch.Tensor]): tensor with the shape and dtype of the
+          result, :math:`(B, N, D)`, where the result is written and returned.
+          It can be :math:`points_1` itself. Default: None.
     Returns:
         torch.Tensor: tensor of N-dimensional points.
 
@@ -195,7 +203,7 @@ def transform_points(trans_01: torch.Tensor,
         >>> trans_01 = torch.eye(4).view(1, 4, 4)  # Bx4x4
         >>> points_0 = kornia.transform_points(trans_01, points_1)  # BxNx3
     """
-    if not torch.is_tensor(trans_01) or not torch.is_tensor(points_1):
+    if not isinstance(trans_01, torch.Tensor) or not isinstance(points_1, torch.Tensor):
         raise TypeError("Input type is not a torch.Tensor")
     if not trans_01.device == points_1.device:
         raise TypeError("Tensor must be in the same device")
@@ -203,14 +211,47 @@ def transform_points(trans_01: torch.Tensor,
         raise ValueError("Input batch size must be the same for both tensors or 1")
     if not trans_01.shape[-1] == (points_1.shape[-1] + 1):
         raise ValueError("Last input dimensions must differe by one unit")
-    # to homogeneous
-    points_1_h = convert_points_to_homogeneous(points_1)  # BxNxD+1
+    # when a single transformation is shared by all the points we can fold
+    # the batch into the rows of one matrix product instead of batching it.
+    shared: bool = (trans_01.numel() == trans_01.shape[-2] * trans_01.shape[-1] and
+                    trans_01.dim() <= points_1.dim())
+    if shared:
+        trans_01 = trans_01.reshape(trans_01.shape[-2:])  # D+1xD+1
+    if not projection:
+        # the last row of an affine transformation is not needed
+        trans_01 = trans_01[..., :-1, :]  # BxDxD+1
+    # split the transformation into its linear part and the column applied to
+    # the homogeneous coordinate, which is added as a bias to avoid padding
+    # the points with ones.
+    rmat_01: torch.Tensor = trans_01[..., :-1]  # BxD+1xD or BxDxD
+    tvec_01: torch.Tensor = trans_01[..., -1:]  # BxD+1x1 or BxDx1
     # transform coordinates
-    points_0_h = torch.matmul(
-        trans_01.unsqueeze(1), points_1_h.unsqueeze(-1))
-    points_0_h = torch.squeeze(points_0_h, dim=-1)
-    # to euclidean
-    points_0 = convert_points_from_homogeneous(points_0_h)  # BxNxD
+    if shared:
+        points_0 = torch.addmm(
+            tvec_01.t(), points_1.reshape(-1, points_1.shape[-1]), rmat_01.t())
+        points_0 = points_0.view(list(points_1.shape[:-1]) + [-1])
+    else:
+        # the transposed matrices are small, making them contiguous is cheap
+        # and keeps the batched product on the folded gemm path.
+        rmat_01_t: torch.Tensor = rmat_01.transpose(-2, -1).contiguous()
+        tvec_01_t: torch.Tensor = tvec_01.transpose(-2, -1)
+        if points_1.dim() == 3 and trans_01.dim() == 3 and trans_01.shape[0] == points_1.shape[0]:
+            points_0 = torch.baddbmm(
+                tvec_01_t.expand(-1, points_1.shape[1], -1), points_1.contiguous(), rmat_01_t)
+        else:
+            points_0 = torch.matmul(points_1.contiguous(), rmat_01_t) + tvec_01_t
+    if projection:
+        # to euclidean
+        points_0 = convert_points_from_homogeneous(points_0)  # BxNxD
+    if out is not None:
+        # the result is computed before writing, so out may alias points_1
+        if not out.shape == points_0.shape:
+            raise ValueError("Output size must be a {} tensor. Got {}"
+                             .format(points_0.shape, out.shape))
+        if not out.dtype == points_0.dtype:
+            raise ValueError("Output dtype must be {}. Got {}"
+                             .format(points_0.dtype, out.dtype))
+        return out.copy_(points_0)
     return points_0
 
 
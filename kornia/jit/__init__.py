@@ -9,3 +9,5 @@ spatial_soft_argmax2d = torch.jit.script(K.geometry.spatial_soft_argmax2d)
 spatial_softmax2d = torch.jit.script(K.geometry.dsnt.spatial_softmax2d)
 spatial_expectation2d = torch.jit.script(K.geometry.dsnt.spatial_expectation2d)
 render_gaussian2d = torch.jit.script(K.geometry.dsnt.render_gaussian2d)
+
+transform_points = torch.jit.script(K.geometry.linalg.transform_points)
@@ -111,6 +111,15 @@ class TestRotationMatrixToQuaternion:
         torch.set_printoptions(precision=10)
         assert_allclose(quaternion_true, quaternion)
 
+    def test_non_contiguous(self, device):
+        angle_axis = torch.rand(4, 3).to(device)
+        matrix = kornia.angle_axis_to_rotation_matrix(angle_axis)
+        matrix_t = matrix.transpose(-2, -1)
+        assert not matrix_t.is_contiguous()
+        quaternion = kornia.rotation_matrix_to_quaternion(matrix_t)
+        expected = kornia.rotation_matrix_to_quaternion(matrix_t.contiguous())
+        assert_allclose(quaternion, expected)
+
     def test_gradcheck(self, device):
         matrix = torch.eye(3).to(device)
         matrix = tensor_to_gradcheck_var(matrix)
@@ -561,6 +570,67 @@ def test_angle_axis_to_rotation_matrix(batch_size, device):
                      raise_exception=True)
 
 
+@pytest.mark.parametrize("batch_shape", [(3,), (2, 3), (2, 4, 3)])
+def test_angle_axis_to_rotation_matrix_batch_shape(batch_shape, device):
+    angle_axis = torch.rand(batch_shape).to(device)
+    rotation_matrix = kornia.angle_axis_to_rotation_matrix(angle_axis)
+    assert rotation_matrix.shape == (*batch_shape[:-1], 3, 3)
+
+    # must match the rotations computed one by one
+    expected = kornia.angle_axis_to_rotation_matrix(angle_axis.view(-1, 3))
+    assert_allclose(rotation_matrix.view(-1, 3, 3), expected)
+
+
+def test_angle_axis_to_rotation_matrix_out(device):
+    angle_axis = torch.rand(2, 3).to(device)
+    pose = torch.eye(4).repeat(2, 1, 1).to(device)
+    rotation_matrix = kornia.angle_axis_to_rotation_matrix(
+        angle_axis, out=pose[..., :3, :3])
+    assert rotation_matrix.data_ptr() == pose.data_ptr()
+    assert_allclose(pose[..., :3, :3], kornia.angle_axis_to_rotation_matrix(angle_axis))
+    assert_allclose(pose[..., 3, :], torch.tensor([0., 0., 0., 1.]).expand(2, 4).to(device))
+
+    # the output shape is not broadcast
+    with pytest.raises(ValueError):
+        kornia.angle_axis_to_rotation_matrix(
+            angle_axis[:1], out=torch.empty(5, 3, 3).to(device))
+
+
+def test_angle_axis_to_rotation_matrix_small_angle(device):
+    # mix the taylor and the rodrigues cases in the same batch
+    angle_axis = torch.tensor([[0., 0., 0.],
+                               [0., 0., 1e-4],
+                               [0., 0., kornia.pi / 2.]]).to(device)
+    expected = torch.tensor([[[1., 0., 0.],
+                              [0., 1., 0.],
+                              [0., 0., 1.]],
+                             [[1., -1e-4, 0.],
+                              [1e-4, 1., 0.],
+                              [0., 0., 1.]],
+                             [[0., -1., 0.],
+                              [1., 0., 0.],
+                              [0., 0., 1.]]]).to(device)
+
+    rotation_matrix = kornia.angle_axis_to_rotation_matrix(angle_axis)
+    assert_allclose(rotation_matrix, expected)
+
+
+@pytest.mark.parametrize("batch_size", [1, 2, 5])
+def test_rtvec_to_pose(batch_size, device):
+    # generate input data
+    rtvec = torch.rand(batch_size, 6).to(device)
+
+    pose = kornia.rtvec_to_pose(rtvec)
+    assert pose.shape == (batch_size, 4, 4)
+    assert_allclose(pose[..., :3, :3], kornia.angle_axis_to_rotation_matrix(rtvec[..., :3]))
+    assert_allclose(pose[..., :3, 3], rtvec[..., 3:])
+    assert_allclose(pose[..., 3, :], torch.tensor([0., 0., 0., 1.]).expand(batch_size, 4).to(device))
+
+    # evaluate function gradient
+    rtvec = tensor_to_gradcheck_var(rtvec)  # to var
+    assert gradcheck(kornia.rtvec_to_pose, (rtvec,), raise_exception=True)
+
+
 '''@pytest.mark.parametrize("batch_size", [1, 2, 5])
 def test_rotation_matrix_to_angle_axis_gradcheck(batch_size, device_type):
     # generate input data
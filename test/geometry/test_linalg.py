@@ -1,3 +1,5 @@
+import io
+
 import pytest
 
 import kornia
@@ -67,6 +69,116 @@ class TestTransformPoints:
         # projected should be equal as initial
         assert_allclose(points_src, points_dst_to_src)
 
+    @pytest.mark.parametrize("batch_size", [1, 2, 5])
+    @pytest.mark.parametrize("num_dims", [2, 3])
+    def test_transform_points_affine(self, device, batch_size, num_dims):
+        # generate input data
+        eye_size = num_dims + 1
+        points_src = torch.rand(batch_size, 4, num_dims).to(device)
+
+        dst_trans_src = torch.eye(eye_size).repeat(batch_size, 1, 1)
+        dst_trans_src[:, :-1] += torch.rand(batch_size, num_dims, eye_size)
+        dst_trans_src = dst_trans_src.to(device)
+
+        # the affine path must match the projective one
+        points_dst = kornia.transform_points(
+            dst_trans_src, points_src, projection=False)
+        expected = kornia.transform_points(dst_trans_src, points_src)
+        assert_allclose(points_dst, expected)
+
+    @pytest.mark.parametrize("projection", [True, False])
+    def test_transform_points_shared(self, device, projection):
+        # generate input data
+        batch_size, num_points, num_dims = 3, 5, 3
+        points_src = torch.rand(batch_size, num_points, num_dims).to(device)
+
+        dst_trans_src = torch.eye(num_dims + 1)[None]
+        dst_trans_src[:, :-1] += torch.rand(1, num_dims, num_dims + 1)
+        dst_trans_src = dst_trans_src.to(device)
+
+        # a single transformation must match the same one repeated per batch
+        points_dst = kornia.transform_points(
+            dst_trans_src, points_src, projection=projection)
+        expected = kornia.transform_points(
+            dst_trans_src.repeat(batch_size, 1, 1), points_src, projection=projection)
+        assert points_dst.shape == points_src.shape
+        assert_allclose(points_dst, expected)
+
+    @pytest.mark.parametrize("batch_size", [1, 2])
+    @pytest.mark.parametrize("projection", [True, False])
+    def test_transform_points_out(self, device, batch_size, projection):
+        # generate input data
+        points_src = torch.rand(batch_size, 5, 3).to(device)
+        dst_trans_src = torch.eye(4).repeat(batch_size, 1, 1)
+        dst_trans_src[:, :-1] += torch.rand(batch_size, 3, 4)
+        dst_trans_src = dst_trans_src.to(device)
+
+        out = torch.empty_like(points_src)
+        points_dst = kornia.transform_points(
+            dst_trans_src, points_src, projection=projection, out=out)
+        expected = kornia.transform_points(
+            dst_trans_src, points_src, projection=projection)
+        assert points_dst.data_ptr() == out.data_ptr()
+        assert_allclose(out, expected)
+
+    @pytest.mark.parametrize("batch_size", [1, 2])
+    @pytest.mark.parametrize("projection", [True, False])
+    def test_transform_points_out_inplace(self, device, batch_size, projection):
+        # generate input data
+        points_src = torch.rand(batch_size, 5, 3).to(device)
+        dst_trans_src = torch.eye(4).repeat(batch_size, 1, 1)
+        dst_trans_src[:, :-1] += torch.rand(batch_size, 3, 4)
+        dst_trans_src = dst_trans_src.to(device)
+
+        expected = kornia.transform_points(
+            dst_trans_src, points_src, projection=projection)
+        points_dst = kornia.transform_points(
+            dst_trans_src, points_src, projection=projection, out=points_src)
+        assert points_dst.data_ptr() == points_src.data_ptr()
+        assert_allclose(points_src, expected)
+
+    @pytest.mark.parametrize("batch_size", [1, 2])
+    @pytest.mark.parametrize("projection", [True, False])
+    def test_transform_points_out_non_contiguous(self, device, batch_size, projection):
+        # generate input data
+        points_src = torch.rand(batch_size, 5, 3).to(device)
+        dst_trans_src = torch.eye(4).repeat(batch_size, 1, 1)
+        dst_trans_src[:, :-1] += torch.rand(batch_size, 3, 4)
+        dst_trans_src = dst_trans_src.to(device)
+
+        out = torch.empty(5, batch_size, 3).to(device).transpose(0, 1)
+        kornia.transform_points(
+            dst_trans_src, points_src, projection=projection, out=out)
+        expected = kornia.transform_points(
+            dst_trans_src, points_src, projection=projection)
+        assert_allclose(out, expected)
+
+    @pytest.mark.parametrize("projection", [True, False])
+    def test_transform_points_out_overlap(self, device, projection):
+        # input and output are different views of the same memory
+        buf = torch.rand(1, 6, 3).to(device)
+        points_src, out = buf[:, :5], buf[:, 1:]
+        dst_trans_src = torch.eye(4)[None]
+        dst_trans_src[:, :-1] += torch.rand(1, 3, 4)
+        dst_trans_src = dst_trans_src.to(device)
+
+        expected = kornia.transform_points(
+            dst_trans_src, points_src.clone(), projection=projection)
+        kornia.transform_points(
+            dst_trans_src, points_src, projection=projection, out=out)
+        assert_allclose(out, expected)
+
+    @pytest.mark.parametrize("projection", [True, False])
+    def test_transform_points_out_invalid(self, device, projection):
+        points_src = torch.rand(1, 5, 3).to(device)
+        dst_trans_src = torch.eye(4)[None].to(device)
+        with pytest.raises(ValueError):
+            kornia.transform_points(dst_trans_src, points_src, projection=projection,
+                                    out=torch.zeros(3, 5, 3).to(device))
+        with pytest.raises(ValueError):
+            kornia.transform_points(dst_trans_src, points_src, projection=projection,
+                                    out=torch.zeros(1, 5, 3, dtype=torch.float64).to(device))
+
     def test_gradcheck(self, device):
         # generate input data
         batch_size, num_points, num_dims = 2, 3, 2
@@ -79,18 +191,27 @@ class TestTransformPoints:
         assert gradcheck(kornia.transform_points, (dst_homo_src, points_src,),
                          raise_exception=True)
 
-    @pytest.mark.skip(reason="turn off all jit for a while")
-    def test_jit(self, device):
-        @torch.jit.script
-        def op_script(transform, points):
-            return kornia.transform_points(transform, points)
-
-        points = torch.ones(1, 2, 2).to(device)
-        transform = torch.eye(3)[None].to(device)
-        actual = op_script(transform, points)
-        expected = kornia.transform_points(transform, points)
-
-        assert_allclose(actual, expected)
+    @pytest.mark.parametrize("num_dims", [2, 3])
+    @pytest.mark.parametrize("projection", [True, False])
+    def test_jit(self, device, num_dims, projection):
+        points = torch.rand(2, 5, num_dims).to(device)
+        transform = torch.eye(num_dims + 1)[None].to(device)
+        transform[..., :-1, :] += torch.rand(1, num_dims, num_dims + 1).to(device)
+        op = kornia.transform_points
+        op_jit = kornia.jit.transform_points
+        assert_allclose(op(transform, points, projection),
+                        op_jit(transform, points, projection))
+
+    def test_jit_save(self, device):
+        buf = io.BytesIO()
+        torch.jit.save(kornia.jit.transform_points, buf)
+        buf.seek(0)
+        op_jit = torch.jit.load(buf, map_location=device)
+
+        points = torch.rand(2, 5, 3).to(device)
+        transform = torch.eye(4)[None].to(device)
+        assert_allclose(op_jit(transform, points, True, None),
+                        kornia.transform_points(transform, points))
 
     @pytest.mark.skip(reason="turn off all jit for a while")
     def test_jit_trace(self, device):
@@ -0,0 +1,22 @@
+import pytest
+from time import time
+
+import torch
+import kornia as kornia
+
+
+batch_sizes = [1024, 65536, 1048576]
+
+
+def test_performance_speed(device, dtype):
+    if device.type != 'cuda' or not torch.cuda.is_available():
+        pytest.skip("Cuda not available in system,")
+
+    print("Benchmarking angle_axis_to_rotation_matrix")
+    for BS in batch_sizes:
+        angle_axis = torch.rand(BS, 3).to(device, dtype)
+        torch.cuda.synchronize(device)
+        t = time()
+        rotation_matrix = kornia.angle_axis_to_rotation_matrix(angle_axis)
+        torch.cuda.synchronize(device)
+        print(f"batch_size={BS}, dev={device}, {time() - t}, sec")